@@ -1,21 +1,239 @@
+import itertools
 import pathlib
 import re
 
 from tqdm.notebook import tqdm
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
 import yaml
 
 def get_config(path: str) -> dict:
     """Open a yaml file and return the contents."""
     with open(path) as input_file:
         return yaml.safe_load(input_file)
-    
-def load_ebsd_alpha(config_path: str):
+
+CHUNK_SIZE = 100000
+# Number of rows in each block read by the chunked results reader.
+
+CHUNK_THRESHOLD = 50*1024*1024
+# File size (bytes) above which the loaders fall back to the chunked results reader.
+
+def iterate_results_file(results_file: str, n_columns: int, chunk_size: int = CHUNK_SIZE, dtype = float):
+    """Iterate over a texture results text file in fixed-size blocks
+    of rows, so that very long frame series can be processed with
+    memory that does not depend on the length of the file.
+
+    :param results_file: File path to the texture results text file.
+    :param n_columns: Number of columns to read, starting from the image number column.
+    :param chunk_size: Number of rows in each block.
+    :param dtype: Data type of the blocks, use np.float32 to halve the memory.
+
+    :return: Generator yielding 2D arrays of texture results,
+    with up to chunk_size rows and n_columns columns.
+    """
+    with open(results_file) as file:
+        file.readline()
+        while True:
+            lines = list(itertools.islice(file, chunk_size))
+            if not lines:
+                break
+            chunk = np.loadtxt(lines, usecols = np.arange(0,n_columns), dtype = dtype, ndmin = 2)
+            if len(chunk) > 0:
+                yield chunk
+
+def iterate_multihit_results(config_path: str, phase: str, n_columns: int = 9,
+                             chunk_size: int = CHUNK_SIZE, dtype = float):
+    """Iterate over the SXRD texture results refined using Continuous-Peak-Fit
+    for each stage of a multi-hit experiment in fixed-size blocks of rows,
+    with the image numbers offset to run continuously across the stages.
+
+    :param config_path: path to the configuration file.
+    :param phase: Phase (alpha or beta) used to select the results file.
+    :param n_columns: Number of columns to read, starting from the image number column.
+    :param chunk_size: Number of rows in each block.
+    :param dtype: Data type of the blocks, use np.float32 to halve the memory.
+
+    :return: Generator yielding the stage number and a 2D array of texture results.
+    """
+    config = get_config(config_path)
+
+    sxrd_experiment_number = config["user_inputs"]["sxrd_experiment_number"]
+    stage_numbers = config["user_inputs"]["stage_number"]
+    image_number_end = config["user_inputs"]["image_number_end"]
+
+    image_number_last = 0
+
+    for count, stage_number in enumerate(stage_numbers):
+
+        sxrd_cpf_results_file = config["file_paths"][f"sxrd_cpf_{phase}_results_file"].format(experiment_number = sxrd_experiment_number, stage_number = stage_number)
+
+        for chunk in iterate_results_file(sxrd_cpf_results_file, n_columns, chunk_size, dtype):
+            chunk[:,0] = chunk[:,0] + image_number_last
+            yield stage_number, chunk
+
+        image_number_last = image_number_last + image_number_end[count]
+
+def read_results_file(results_file: str, n_columns: int, dtype = float, chunk_threshold: int = CHUNK_THRESHOLD):
+    """Read a texture results text file into a 2D array. Files larger
+    than the threshold are counted once and then filled into a 
+    preallocated array block by block with the chunked results reader, 
+    so memory peaks at the final array plus one block. The whole file 
+    is still returned as one array, so use the iterate_* and stream_* 
+    functions to keep memory independent of the length of the file.
+
+    :param results_file: File path to the texture results text file.
+    :param n_columns: Number of columns to read, starting from the image number column.
+    :param dtype: Data type of the array, use np.float32 to halve the memory.
+    :param chunk_threshold: File size (bytes) above which the file is read in chunks.
+
+    :return: 2D array of texture results.
+    """
+    if pathlib.Path(results_file).stat().st_size > chunk_threshold:
+        with open(results_file) as file:
+            file.readline()
+            n_rows = sum(1 for line in file if line.strip())
+        
+        results = np.empty((n_rows, n_columns), dtype)
+        row = 0
+        for chunk in iterate_results_file(results_file, n_columns, dtype = dtype):
+            results[row:row + len(chunk)] = chunk
+            row += len(chunk)
+        
+        return results[:row]
+
+    return np.loadtxt(results_file, usecols = np.arange(0,n_columns), dtype = dtype, skiprows = 1, ndmin = 2)
+
+def stream_window_statistics(chunks, column: int, window: int) -> dict:
+    """Calculate the minimum, maximum and mean of a texture results
+    column over consecutive windows of frames, from blocks of rows
+    produced by the chunked results reader.
+
+    :param chunks: Iterable of 2D arrays of texture results, with image number in the first column.
+    :param column: Index of the column to reduce i.e. 1 for texture index, 2 for ODF maxima.
+    :param window: Number of frames in each window.
+
+    :return: Dictionary containing arrays of the first image number,
+    minimum, maximum and mean in each window. The minimum and maximum
+    keep the data type of the blocks, the mean is accumulated in float64.
+    """
+    if window <= 0:
+        raise ValueError(f"window must be a positive number of frames, not {window}.")
+
+    image_number, minimum, maximum, mean = [], [], [], []
+    image_number_remainder = None
+    values_remainder = None
+
+    for chunk in chunks:
+        if values_remainder is None:
+            image_number_remainder = chunk[:0,0]
+            values_remainder = chunk[:0,column]
+        image_numbers = np.concatenate((image_number_remainder, chunk[:,0]))
+        values = np.concatenate((values_remainder, chunk[:,column]))
+        n_full = (len(values) // window)*window
+
+        if n_full > 0:
+            windows = values[:n_full].reshape(-1, window)
+            image_number.append(image_numbers[:n_full:window])
+            minimum.append(windows.min(axis = 1))
+            maximum.append(windows.max(axis = 1))
+            mean.append(windows.mean(axis = 1, dtype = np.float64))
+
+        image_number_remainder = image_numbers[n_full:]
+        values_remainder = values[n_full:]
+
+    if values_remainder is not None and len(values_remainder) > 0:
+        image_number.append(image_number_remainder[:1])
+        minimum.append(values_remainder.min(keepdims = True))
+        maximum.append(values_remainder.max(keepdims = True))
+        mean.append(values_remainder.mean(dtype = np.float64, keepdims = True))
+
+    window_statistics = {
+                    "image_number" : np.concatenate(image_number) if image_number else np.empty(0),
+                    "min" : np.concatenate(minimum) if minimum else np.empty(0),
+                    "max" : np.concatenate(maximum) if maximum else np.empty(0),
+                    "mean" : np.concatenate(mean) if mean else np.empty(0),
+                    }
+
+    return window_statistics
+
+def stream_stage_summaries(stage_chunks, column: int) -> dict:
+    """Calculate the first and last image number, minimum, maximum and
+    mean of a texture results column for each stage of a multi-hit
+    experiment, from blocks of rows produced by iterate_multihit_results.
+
+    :param stage_chunks: Iterable of stage numbers and 2D arrays of texture results.
+    :param column: Index of the column to reduce i.e. 1 for texture index, 2 for ODF maxima.
+
+    :return: Dictionary containing arrays of the stage summaries, with one value per stage.
+    """
+    summaries = {}
+
+    for stage_number, chunk in stage_chunks:
+        values = chunk[:,column]
+        if stage_number not in summaries:
+            summaries[stage_number] = {
+                            "image_number_start" : chunk[0,0],
+                            "min" : values.min(),
+                            "max" : values.max(),
+                            "sum" : 0.0,
+                            "count" : 0,
+                            }
+        summary = summaries[stage_number]
+        summary["image_number_end"] = chunk[-1,0]
+        summary["min"] = min(summary["min"], values.min())
+        summary["max"] = max(summary["max"], values.max())
+        summary["sum"] += values.sum(dtype = np.float64)
+        summary["count"] += len(values)
+
+    stage_summaries = {
+                    "stage_number" : np.array(list(summaries.keys())),
+                    "image_number_start" : np.array([summary["image_number_start"] for summary in summaries.values()]),
+                    "image_number_end" : np.array([summary["image_number_end"] for summary in summaries.values()]),
+                    "min" : np.array([summary["min"] for summary in summaries.values()]),
+                    "max" : np.array([summary["max"] for summary in summaries.values()]),
+                    "mean" : np.array([summary["sum"]/summary["count"] for summary in summaries.values()]),
+                    }
+
+    return stage_summaries
+
+def stream_decimated_series(chunks, column: int, step: int) -> dict:
+    """Decimate a texture results column to every step-th frame, from
+    blocks of rows produced by the chunked results reader, to give a
+    series that can be plotted without loading the whole file.
+
+    :param chunks: Iterable of 2D arrays of texture results, with image number in the first column.
+    :param column: Index of the column to decimate i.e. 1 for texture index, 2 for ODF maxima.
+    :param step: Keep one frame in every step frames.
+
+    :return: Dictionary containing arrays of the decimated image numbers and values.
+    """
+    if step <= 0:
+        raise ValueError(f"step must be a positive number of frames, not {step}.")
+
+    image_number, values = [], []
+    offset = 0
+
+    for chunk in chunks:
+        start = (-offset) % step
+        image_number.append(chunk[start::step,0])
+        values.append(chunk[start::step,column])
+        offset += len(chunk)
+
+    decimated_series = {
+                    "image_number" : np.concatenate(image_number) if image_number else np.empty(0),
+                    "values" : np.concatenate(values) if values else np.empty(0),
+                    }
+
+    return decimated_series
+
+def load_ebsd_alpha(config_path: str, dtype = float, chunk_threshold: int = CHUNK_THRESHOLD):
     """Load EBSD alpha-phase texture results from text file 
     based on input parameters from a yaml configuration file.
     
     :param config_path: path to the configuration file.
+    :param dtype: Data type of the texture results arrays, use np.float32 to halve the memory.
+    :param chunk_threshold: File size (bytes) above which the results file is read in chunks.
     
     :return: EBSD alpha texture results as a dictionary, 
     containing arrays of texture refinement data.
@@ -24,7 +242,7 @@ def load_ebsd_alpha(config_path: str):
     
     ebsd_alpha_results_file = config["file_paths"]["ebsd_alpha_results_file"]
     print("The EBSD results file is: ", ebsd_alpha_results_file, sep = '\n', end = '\n\n')
-    ebsd_results = np.loadtxt(ebsd_alpha_results_file, usecols = np.arange(0,11), dtype='str', skiprows = 1)
+    ebsd_results = read_results_file(ebsd_alpha_results_file, 11, dtype = dtype, chunk_threshold = chunk_threshold)
     
     print("The data headers from the EBSD results file are...", sep = '\n', end = '\n\n')
     with open (ebsd_alpha_results_file) as file:
@@ -33,28 +251,30 @@ def load_ebsd_alpha(config_path: str):
             print('header column ', i ,' = ', header[i])
     
     ebsd_alpha_results = {
-                    "image_number" : ebsd_results[:,0].astype(float),
-                    "texture_index" : ebsd_results[:,1].astype(float),
-                    "odf_max" : ebsd_results[:,2].astype(float),
-                    "phi1" : ebsd_results[:,3].astype(float),
-                    "PHI" : ebsd_results[:,4].astype(float),
-                    "phi2" : ebsd_results[:,5].astype(float),
-                    "0002_pf_max" : ebsd_results[:,6].astype(float),
-                    "10-10_pf_max" : ebsd_results[:,7].astype(float),
-                    "11-20_pf_max" : ebsd_results[:,8].astype(float),
-                    "basal_TD_volume" : ebsd_results[:,9].astype(float),
-                    "basal_RD_volume" : ebsd_results[:,10].astype(float),
+                    "image_number" : ebsd_results[:,0].astype(dtype, copy = False),
+                    "texture_index" : ebsd_results[:,1].astype(dtype, copy = False),
+                    "odf_max" : ebsd_results[:,2].astype(dtype, copy = False),
+                    "phi1" : ebsd_results[:,3].astype(dtype, copy = False),
+                    "PHI" : ebsd_results[:,4].astype(dtype, copy = False),
+                    "phi2" : ebsd_results[:,5].astype(dtype, copy = False),
+                    "0002_pf_max" : ebsd_results[:,6].astype(dtype, copy = False),
+                    "10-10_pf_max" : ebsd_results[:,7].astype(dtype, copy = False),
+                    "11-20_pf_max" : ebsd_results[:,8].astype(dtype, copy = False),
+                    "basal_TD_volume" : ebsd_results[:,9].astype(dtype, copy = False),
+                    "basal_RD_volume" : ebsd_results[:,10].astype(dtype, copy = False),
                     }
     print('\n', "The EBSD results have been written to new arrays with the following keys: ", ebsd_alpha_results.keys(), sep = '\n', end = '\n\n')
     
     return ebsd_alpha_results
 
-def load_sxrd_cpf_alpha(config_path: str):
+def load_sxrd_cpf_alpha(config_path: str, dtype = float, chunk_threshold: int = CHUNK_THRESHOLD):
     """Load SXRD alpha-phase texture results refined using 
     Continuous-Peak-Fit, using Fourier peak analysis, from 
     text file based on input parameters from a yaml configuration file.
     
     :param config_path: path to the configuration file.
+    :param dtype: Data type of the texture results arrays, use np.float32 to halve the memory.
+    :param chunk_threshold: File size (bytes) above which the results file is read in chunks.
     
     :return: SXRD alpha texture results from Continuous-Peak-Fit 
     as a dictionary, containing arrays of texture refinement data.
@@ -67,30 +287,32 @@ def load_sxrd_cpf_alpha(config_path: str):
     sxrd_cpf_alpha_results_file = config["file_paths"]["sxrd_cpf_alpha_results_file"].format(experiment_number = sxrd_experiment_number)
     print("The SXRD results file is: ", sxrd_cpf_alpha_results_file, sep = '\n', end = '\n\n')
 
-    sxrd_cpf_results = np.loadtxt(sxrd_cpf_alpha_results_file, usecols = np.arange(0,9), dtype='str', skiprows = 1)
+    sxrd_cpf_results = read_results_file(sxrd_cpf_alpha_results_file, 9, dtype = dtype, chunk_threshold = chunk_threshold)
     
     cpf_alpha_results = {
-                    "image_number" : sxrd_cpf_results[:,0].astype(float),
-                    "texture_index" : sxrd_cpf_results[:,1].astype(float),
-                    "odf_max" : sxrd_cpf_results[:,2].astype(float),
-                    "phi1" : sxrd_cpf_results[:,3].astype(float),
-                    "PHI" : sxrd_cpf_results[:,4].astype(float),
-                    "phi2" : sxrd_cpf_results[:,5].astype(float),
-                    "0002_pf_max" : sxrd_cpf_results[:,6].astype(float),
-                    "10-10_pf_max" : sxrd_cpf_results[:,7].astype(float),
-                    "11-20_pf_max" : sxrd_cpf_results[:,8].astype(float),
+                    "image_number" : sxrd_cpf_results[:,0].astype(dtype, copy = False),
+                    "texture_index" : sxrd_cpf_results[:,1].astype(dtype, copy = False),
+                    "odf_max" : sxrd_cpf_results[:,2].astype(dtype, copy = False),
+                    "phi1" : sxrd_cpf_results[:,3].astype(dtype, copy = False),
+                    "PHI" : sxrd_cpf_results[:,4].astype(dtype, copy = False),
+                    "phi2" : sxrd_cpf_results[:,5].astype(dtype, copy = False),
+                    "0002_pf_max" : sxrd_cpf_results[:,6].astype(dtype, copy = False),
+                    "10-10_pf_max" : sxrd_cpf_results[:,7].astype(dtype, copy = False),
+                    "11-20_pf_max" : sxrd_cpf_results[:,8].astype(dtype, copy = False),
                     }
     
     print("The SXRD results using Fourier peak analysis have been written to new arrays with the following keys: ", cpf_alpha_results.keys(), sep = '\n', end = '\n\n')
     
     return cpf_alpha_results
 
-def load_sxrd_cpf_alpha_additional(config_path: str):
+def load_sxrd_cpf_alpha_additional(config_path: str, dtype = float, chunk_threshold: int = CHUNK_THRESHOLD):
     """Load SXRD additional alpha-phase texture component phase fraction
     results refined using Continuous-Peak-Fit, using Fourier peak analysis, 
     from text file based on input parameters from a yaml configuration file.
     
     :param config_path: path to the configuration file.
+    :param dtype: Data type of the texture results arrays, use np.float32 to halve the memory.
+    :param chunk_threshold: File size (bytes) above which the results file is read in chunks.
     
     :return: SXRD alpha texture results from Continuous-Peak-Fit 
     as a dictionary, containing arrays of texture refinement data.
@@ -103,26 +325,28 @@ def load_sxrd_cpf_alpha_additional(config_path: str):
     sxrd_cpf_alpha_results_file = config["file_paths"]["sxrd_cpf_alpha_results_file"].format(experiment_number = sxrd_experiment_number)
     print("The SXRD results file is: ", sxrd_cpf_alpha_results_file, sep = '\n', end = '\n\n')
 
-    sxrd_cpf_results_additional = np.loadtxt(sxrd_cpf_alpha_results_file, usecols = np.arange(0,13), dtype='str', skiprows = 1)
+    sxrd_cpf_results_additional = read_results_file(sxrd_cpf_alpha_results_file, 13, dtype = dtype, chunk_threshold = chunk_threshold)
     
     cpf_alpha_results_additional = {
-                    "image_number" : sxrd_cpf_results_additional[:,0].astype(float),
-                    "basal_TD_volume_fraction": sxrd_cpf_results_additional[:,9].astype(float),
-                    "basal_ND_volume_fraction": sxrd_cpf_results_additional[:,10].astype(float),
-                    "basal_RD_volume_fraction": sxrd_cpf_results_additional[:,11].astype(float),
-                    "basal_45_volume_fraction": sxrd_cpf_results_additional[:,12].astype(float)
+                    "image_number" : sxrd_cpf_results_additional[:,0].astype(dtype, copy = False),
+                    "basal_TD_volume_fraction": sxrd_cpf_results_additional[:,9].astype(dtype, copy = False),
+                    "basal_ND_volume_fraction": sxrd_cpf_results_additional[:,10].astype(dtype, copy = False),
+                    "basal_RD_volume_fraction": sxrd_cpf_results_additional[:,11].astype(dtype, copy = False),
+                    "basal_45_volume_fraction": sxrd_cpf_results_additional[:,12].astype(dtype, copy = False)
                     }
     
     print("The SXRD results using Fourier peak analysis have been written to new arrays with the following keys: ", cpf_alpha_results_additional.keys(), sep = '\n', end = '\n\n')
     
     return cpf_alpha_results_additional
 
-def load_sxrd_cpf_alpha_multihit(config_path: str):
+def load_sxrd_cpf_alpha_multihit(config_path: str, dtype = float, chunk_threshold: int = CHUNK_THRESHOLD):
     """Load SXRD alpha-phase texture results refined using 
     Continuous-Peak-Fit, using Fourier peak analysis, from 
     text file based on input parameters from a yaml configuration file.
     
     :param config_path: path to the configuration file.
+    :param dtype: Data type of the texture results arrays, use np.float32 to halve the memory.
+    :param chunk_threshold: File size (bytes) above which the results file is read in chunks.
     
     :return: SXRD alpha texture results from Continuous-Peak-Fit 
     as a dictionary, containing arrays of texture refinement data.
@@ -138,7 +362,7 @@ def load_sxrd_cpf_alpha_multihit(config_path: str):
     image_number_end = config["user_inputs"]["image_number_end"]
     print("The image numbers at the end of each stage are: ", image_number_end, sep = '\n', end = '\n\n')
     
-    sxrd_cpf_results = np.empty((0,9), float)
+    sxrd_cpf_results = []
     count = 0
     image_number_last = 0
     
@@ -147,37 +371,42 @@ def load_sxrd_cpf_alpha_multihit(config_path: str):
         sxrd_cpf_alpha_results_file = config["file_paths"]["sxrd_cpf_alpha_results_file"].format(experiment_number = sxrd_experiment_number, stage_number = stage_number)
         print("The SXRD results file is: ", sxrd_cpf_alpha_results_file, sep = '\n', end = '\n\n')
 
-        sxrd_cpf_results_stage = np.loadtxt(sxrd_cpf_alpha_results_file, usecols = np.arange(0,9), dtype='str', skiprows = 1)
-        
-        for i in range(0,len(sxrd_cpf_results_stage)):
-            sxrd_cpf_results_stage[i,0] = sxrd_cpf_results_stage[i,0].astype(float) + image_number_last
+        sxrd_cpf_results_stage = read_results_file(sxrd_cpf_alpha_results_file, 9, dtype = dtype, chunk_threshold = chunk_threshold)
         
-        sxrd_cpf_results = np.append(sxrd_cpf_results, sxrd_cpf_results_stage, axis=0)
+        sxrd_cpf_results_stage[:,0] = sxrd_cpf_results_stage[:,0] + image_number_last
+        sxrd_cpf_results.append(sxrd_cpf_results_stage)
         image_number_last = image_number_last + image_number_end[count]
         count += 1
+    
+    if sxrd_cpf_results:
+        sxrd_cpf_results = np.concatenate(sxrd_cpf_results)
+    else:
+        sxrd_cpf_results = np.empty((0,9), dtype)
         
     cpf_alpha_results = {
-                    "image_number" : sxrd_cpf_results[:,0].astype(float),
-                    "texture_index" : sxrd_cpf_results[:,1].astype(float),
-                    "odf_max" : sxrd_cpf_results[:,2].astype(float),
-                    "phi1" : sxrd_cpf_results[:,3].astype(float),
-                    "PHI" : sxrd_cpf_results[:,4].astype(float),
-                    "phi2" : sxrd_cpf_results[:,5].astype(float),
-                    "0002_pf_max" : sxrd_cpf_results[:,6].astype(float),
-                    "10-10_pf_max" : sxrd_cpf_results[:,7].astype(float),
-                    "11-20_pf_max" : sxrd_cpf_results[:,8].astype(float),
+                    "image_number" : sxrd_cpf_results[:,0].astype(dtype, copy = False),
+                    "texture_index" : sxrd_cpf_results[:,1].astype(dtype, copy = False),
+                    "odf_max" : sxrd_cpf_results[:,2].astype(dtype, copy = False),
+                    "phi1" : sxrd_cpf_results[:,3].astype(dtype, copy = False),
+                    "PHI" : sxrd_cpf_results[:,4].astype(dtype, copy = False),
+                    "phi2" : sxrd_cpf_results[:,5].astype(dtype, copy = False),
+                    "0002_pf_max" : sxrd_cpf_results[:,6].astype(dtype, copy = False),
+                    "10-10_pf_max" : sxrd_cpf_results[:,7].astype(dtype, copy = False),
+                    "11-20_pf_max" : sxrd_cpf_results[:,8].astype(dtype, copy = False),
                     }
     
     print("The SXRD results using Fourier peak analysis have been written to new arrays with the following keys: ", cpf_alpha_results.keys(), sep = '\n', end = '\n\n')
     
     return cpf_alpha_results
     
-def load_sxrd_maud_alpha(config_path: str):
+def load_sxrd_maud_alpha(config_path: str, dtype = float, chunk_threshold: int = CHUNK_THRESHOLD):
     """Load SXRD alpha-phase texture results refined using MAUD,
     using Rietveld refinement analysis, from text file 
     based on input parameters from a yaml configuration file.
     
     :param config_path: path to the configuration file.
+    :param dtype: Data type of the texture results arrays, use np.float32 to halve the memory.
+    :param chunk_threshold: File size (bytes) above which the results file is read in chunks.
     
     :return: SXRD alpha texture results from MAUD as a dictionary, 
     containing arrays of texture refinement data.
@@ -188,28 +417,30 @@ def load_sxrd_maud_alpha(config_path: str):
     print("The SXRD experiment number is: ", sxrd_experiment_number, sep = '\n', end = '\n\n')
     sxrd_maud_alpha_results_file = config["file_paths"]["sxrd_maud_alpha_results_file"].format(experiment_number = sxrd_experiment_number)
     print("The SXRD results file is: ", sxrd_maud_alpha_results_file, sep = '\n', end = '\n\n')
-    sxrd_maud_results = np.loadtxt(sxrd_maud_alpha_results_file, usecols = np.arange(0,9), dtype='str', skiprows = 1)
+    sxrd_maud_results = read_results_file(sxrd_maud_alpha_results_file, 9, dtype = dtype, chunk_threshold = chunk_threshold)
     
     maud_alpha_results = {
-                    "image_number" : sxrd_maud_results[:,0].astype(float),
-                    "texture_index" : sxrd_maud_results[:,1].astype(float),
-                    "odf_max" : sxrd_maud_results[:,2].astype(float),
-                    "phi1" : sxrd_maud_results[:,3].astype(float),
-                    "PHI" : sxrd_maud_results[:,4].astype(float),
-                    "phi2" : sxrd_maud_results[:,5].astype(float),
-                    "0002_pf_max" : sxrd_maud_results[:,6].astype(float),
-                    "10-10_pf_max" : sxrd_maud_results[:,7].astype(float),
-                    "11-20_pf_max" : sxrd_maud_results[:,8].astype(float),
+                    "image_number" : sxrd_maud_results[:,0].astype(dtype, copy = False),
+                    "texture_index" : sxrd_maud_results[:,1].astype(dtype, copy = False),
+                    "odf_max" : sxrd_maud_results[:,2].astype(dtype, copy = False),
+                    "phi1" : sxrd_maud_results[:,3].astype(dtype, copy = False),
+                    "PHI" : sxrd_maud_results[:,4].astype(dtype, copy = False),
+                    "phi2" : sxrd_maud_results[:,5].astype(dtype, copy = False),
+                    "0002_pf_max" : sxrd_maud_results[:,6].astype(dtype, copy = False),
+                    "10-10_pf_max" : sxrd_maud_results[:,7].astype(dtype, copy = False),
+                    "11-20_pf_max" : sxrd_maud_results[:,8].astype(dtype, copy = False),
                     }
     print("The SXRD results using MAUD have been written to new arrays with the following keys: ", maud_alpha_results.keys(), sep = '\n', end = '\n\n')
     
     return maud_alpha_results
 
-def load_ebsd_beta(config_path: str):
+def load_ebsd_beta(config_path: str, dtype = float, chunk_threshold: int = CHUNK_THRESHOLD):
     """Load EBSD beta-phase texture results from text file 
     based on input parameters from a yaml configuration file.
     
     :param config_path: path to the configuration file.
+    :param dtype: Data type of the texture results arrays, use np.float32 to halve the memory.
+    :param chunk_threshold: File size (bytes) above which the results file is read in chunks.
     
     :return: EBSD beta texture results as a dictionary, 
     containing arrays of texture refinement data.
@@ -218,7 +449,7 @@ def load_ebsd_beta(config_path: str):
     
     ebsd_beta_results_file = config["file_paths"]["ebsd_beta_results_file"]
     print("The EBSD results file is: ", ebsd_beta_results_file, sep = '\n', end = '\n\n')
-    ebsd_results = np.loadtxt(ebsd_beta_results_file, usecols = np.arange(0,12), dtype='str', skiprows = 1)
+    ebsd_results = read_results_file(ebsd_beta_results_file, 12, dtype = dtype, chunk_threshold = chunk_threshold)
     
     print("The data headers from the EBSD results file are...", sep = '\n', end = '\n\n')
     with open (ebsd_beta_results_file) as file:
@@ -227,29 +458,31 @@ def load_ebsd_beta(config_path: str):
             print('header column ', i ,' = ', header[i])
             
     ebsd_beta_results = {
-                    "image_number" : ebsd_results[:,0].astype(float),
-                    "texture_index" : ebsd_results[:,1].astype(float),
-                    "odf_max" : ebsd_results[:,2].astype(float),
-                    "phi1" : ebsd_results[:,3].astype(float),
-                    "PHI" : ebsd_results[:,4].astype(float),
-                    "phi2" : ebsd_results[:,5].astype(float),
-                    "001_pf_max" : ebsd_results[:,6].astype(float),
-                    "110_pf_max" : ebsd_results[:,7].astype(float),
-                    "111_pf_max" : ebsd_results[:,8].astype(float),
-                    "rotated_cube_volume" : ebsd_results[:,9].astype(float),
-                    "alpha_fibre_volume" : ebsd_results[:,10].astype(float),
-                    "gamma_fibre_volume" : ebsd_results[:,11].astype(float),
+                    "image_number" : ebsd_results[:,0].astype(dtype, copy = False),
+                    "texture_index" : ebsd_results[:,1].astype(dtype, copy = False),
+                    "odf_max" : ebsd_results[:,2].astype(dtype, copy = False),
+                    "phi1" : ebsd_results[:,3].astype(dtype, copy = False),
+                    "PHI" : ebsd_results[:,4].astype(dtype, copy = False),
+                    "phi2" : ebsd_results[:,5].astype(dtype, copy = False),
+                    "001_pf_max" : ebsd_results[:,6].astype(dtype, copy = False),
+                    "110_pf_max" : ebsd_results[:,7].astype(dtype, copy = False),
+                    "111_pf_max" : ebsd_results[:,8].astype(dtype, copy = False),
+                    "rotated_cube_volume" : ebsd_results[:,9].astype(dtype, copy = False),
+                    "alpha_fibre_volume" : ebsd_results[:,10].astype(dtype, copy = False),
+                    "gamma_fibre_volume" : ebsd_results[:,11].astype(dtype, copy = False),
                     }
     print('\n', "The EBSD results have been written to new arrays with the following keys: ", ebsd_beta_results.keys(), sep = '\n', end = '\n\n')
     
     return ebsd_beta_results
 
-def load_sxrd_cpf_beta(config_path: str):
+def load_sxrd_cpf_beta(config_path: str, dtype = float, chunk_threshold: int = CHUNK_THRESHOLD):
     """Load SXRD beta-phase texture results refined using 
     Continuous-Peak-Fit, using Fourier peak analysis, from 
     text file based on input parameters from a yaml configuration file.
     
     :param config_path: path to the configuration file.
+    :param dtype: Data type of the texture results arrays, use np.float32 to halve the memory.
+    :param chunk_threshold: File size (bytes) above which the results file is read in chunks.
     
     :return: SXRD beta texture results from Continuous-Peak-Fit 
     as a dictionary, containing arrays of texture refinement data.
@@ -262,30 +495,32 @@ def load_sxrd_cpf_beta(config_path: str):
     sxrd_cpf_beta_results_file = config["file_paths"]["sxrd_cpf_beta_results_file"].format(experiment_number = sxrd_experiment_number)
     print("The SXRD results file is: ", sxrd_cpf_beta_results_file, sep = '\n', end = '\n\n')
 
-    sxrd_cpf_results = np.loadtxt(sxrd_cpf_beta_results_file, usecols = np.arange(0,9), dtype='str', skiprows = 1)
+    sxrd_cpf_results = read_results_file(sxrd_cpf_beta_results_file, 9, dtype = dtype, chunk_threshold = chunk_threshold)
     
     cpf_beta_results = {
-                    "image_number" : sxrd_cpf_results[:,0].astype(float),
-                    "texture_index" : sxrd_cpf_results[:,1].astype(float),
-                    "odf_max" : sxrd_cpf_results[:,2].astype(float),
-                    "phi1" : sxrd_cpf_results[:,3].astype(float),
-                    "PHI" : sxrd_cpf_results[:,4].astype(float),
-                    "phi2" : sxrd_cpf_results[:,5].astype(float),
-                    "001_pf_max" : sxrd_cpf_results[:,6].astype(float),
-                    "110_pf_max" : sxrd_cpf_results[:,7].astype(float),
-                    "111_pf_max" : sxrd_cpf_results[:,8].astype(float),
+                    "image_number" : sxrd_cpf_results[:,0].astype(dtype, copy = False),
+                    "texture_index" : sxrd_cpf_results[:,1].astype(dtype, copy = False),
+                    "odf_max" : sxrd_cpf_results[:,2].astype(dtype, copy = False),
+                    "phi1" : sxrd_cpf_results[:,3].astype(dtype, copy = False),
+                    "PHI" : sxrd_cpf_results[:,4].astype(dtype, copy = False),
+                    "phi2" : sxrd_cpf_results[:,5].astype(dtype, copy = False),
+                    "001_pf_max" : sxrd_cpf_results[:,6].astype(dtype, copy = False),
+                    "110_pf_max" : sxrd_cpf_results[:,7].astype(dtype, copy = False),
+                    "111_pf_max" : sxrd_cpf_results[:,8].astype(dtype, copy = False),
                     }
     
     print("The SXRD results using Fourier peak analysis have been written to new arrays with the following keys: ", cpf_beta_results.keys(), sep = '\n', end = '\n\n')
     
     return cpf_beta_results
 
-def load_sxrd_cpf_beta_additional(config_path: str):
+def load_sxrd_cpf_beta_additional(config_path: str, dtype = float, chunk_threshold: int = CHUNK_THRESHOLD):
     """Load SXRD additional beta-phase texture component phase fraction
     results refined using Continuous-Peak-Fit, using Fourier peak analysis, 
     from text file based on input parameters from a yaml configuration file.
     
     :param config_path: path to the configuration file.
+    :param dtype: Data type of the texture results arrays, use np.float32 to halve the memory.
+    :param chunk_threshold: File size (bytes) above which the results file is read in chunks.
     
     :return: SXRD beta texture results from Continuous-Peak-Fit 
     as a dictionary, containing arrays of texture refinement data.
@@ -298,26 +533,28 @@ def load_sxrd_cpf_beta_additional(config_path: str):
     sxrd_cpf_beta_results_file = config["file_paths"]["sxrd_cpf_beta_results_file"].format(experiment_number = sxrd_experiment_number)
     print("The SXRD results file is: ", sxrd_cpf_beta_results_file, sep = '\n', end = '\n\n')
 
-    sxrd_cpf_results_additional = np.loadtxt(sxrd_cpf_beta_results_file, usecols = np.arange(0,13), dtype='str', skiprows = 1)
+    sxrd_cpf_results_additional = read_results_file(sxrd_cpf_beta_results_file, 13, dtype = dtype, chunk_threshold = chunk_threshold)
     
     cpf_beta_results_additional = {
-                    "image_number" : sxrd_cpf_results_additional[:,0].astype(float),
-                    "cube_volume_fraction": sxrd_cpf_results_additional[:,9].astype(float),
-                    "rotated_cube_volume_fraction": sxrd_cpf_results_additional[:,10].astype(float),
-                    "alpha_fibre_volume_fraction": sxrd_cpf_results_additional[:,11].astype(float),
-                    "gamma_fibre_volume_fraction": sxrd_cpf_results_additional[:,12].astype(float)
+                    "image_number" : sxrd_cpf_results_additional[:,0].astype(dtype, copy = False),
+                    "cube_volume_fraction": sxrd_cpf_results_additional[:,9].astype(dtype, copy = False),
+                    "rotated_cube_volume_fraction": sxrd_cpf_results_additional[:,10].astype(dtype, copy = False),
+                    "alpha_fibre_volume_fraction": sxrd_cpf_results_additional[:,11].astype(dtype, copy = False),
+                    "gamma_fibre_volume_fraction": sxrd_cpf_results_additional[:,12].astype(dtype, copy = False)
                     }
     
     print("The SXRD results using Fourier peak analysis have been written to new arrays with the following keys: ", cpf_beta_results_additional.keys(), sep = '\n', end = '\n\n')
     
     return cpf_beta_results_additional
 
-def load_sxrd_cpf_beta_multihit(config_path: str):
+def load_sxrd_cpf_beta_multihit(config_path: str, dtype = float, chunk_threshold: int = CHUNK_THRESHOLD):
     """Load SXRD beta-phase texture results refined using 
     Continuous-Peak-Fit, using Fourier peak analysis, from 
     text file based on input parameters from a yaml configuration file.
     
     :param config_path: path to the configuration file.
+    :param dtype: Data type of the texture results arrays, use np.float32 to halve the memory.
+    :param chunk_threshold: File size (bytes) above which the results file is read in chunks.
     
     :return: SXRD beta texture results from Continuous-Peak-Fit 
     as a dictionary, containing arrays of texture refinement data.
@@ -333,7 +570,7 @@ def load_sxrd_cpf_beta_multihit(config_path: str):
     image_number_end = config["user_inputs"]["image_number_end"]
     print("The image numbers at the end of each stage are: ", image_number_end, sep = '\n', end = '\n\n')
     
-    sxrd_cpf_results = np.empty((0,9), float)
+    sxrd_cpf_results = []
     count = 0
     image_number_last = 0
     
@@ -342,37 +579,42 @@ def load_sxrd_cpf_beta_multihit(config_path: str):
         sxrd_cpf_beta_results_file = config["file_paths"]["sxrd_cpf_beta_results_file"].format(experiment_number = sxrd_experiment_number, stage_number = stage_number)
         print("The SXRD results file is: ", sxrd_cpf_beta_results_file, sep = '\n', end = '\n\n')
     
-        sxrd_cpf_results_stage = np.loadtxt(sxrd_cpf_beta_results_file, usecols = np.arange(0,9), dtype='str', skiprows = 1)
+        sxrd_cpf_results_stage = read_results_file(sxrd_cpf_beta_results_file, 9, dtype = dtype, chunk_threshold = chunk_threshold)
         
-        for i in range(0,len(sxrd_cpf_results_stage)):
-            sxrd_cpf_results_stage[i,0] = sxrd_cpf_results_stage[i,0].astype(float) + image_number_last
-        
-        sxrd_cpf_results = np.append(sxrd_cpf_results, sxrd_cpf_results_stage, axis=0)
+        sxrd_cpf_results_stage[:,0] = sxrd_cpf_results_stage[:,0] + image_number_last
+        sxrd_cpf_results.append(sxrd_cpf_results_stage)
         image_number_last = image_number_last + image_number_end[count]
         count += 1
     
+    if sxrd_cpf_results:
+        sxrd_cpf_results = np.concatenate(sxrd_cpf_results)
+    else:
+        sxrd_cpf_results = np.empty((0,9), dtype)
+    
     cpf_beta_results = {
-                    "image_number" : sxrd_cpf_results[:,0].astype(float),
-                    "texture_index" : sxrd_cpf_results[:,1].astype(float),
-                    "odf_max" : sxrd_cpf_results[:,2].astype(float),
-                    "phi1" : sxrd_cpf_results[:,3].astype(float),
-                    "PHI" : sxrd_cpf_results[:,4].astype(float),
-                    "phi2" : sxrd_cpf_results[:,5].astype(float),
-                    "001_pf_max" : sxrd_cpf_results[:,6].astype(float),
-                    "110_pf_max" : sxrd_cpf_results[:,7].astype(float),
-                    "111_pf_max" : sxrd_cpf_results[:,8].astype(float),
+                    "image_number" : sxrd_cpf_results[:,0].astype(dtype, copy = False),
+                    "texture_index" : sxrd_cpf_results[:,1].astype(dtype, copy = False),
+                    "odf_max" : sxrd_cpf_results[:,2].astype(dtype, copy = False),
+                    "phi1" : sxrd_cpf_results[:,3].astype(dtype, copy = False),
+                    "PHI" : sxrd_cpf_results[:,4].astype(dtype, copy = False),
+                    "phi2" : sxrd_cpf_results[:,5].astype(dtype, copy = False),
+                    "001_pf_max" : sxrd_cpf_results[:,6].astype(dtype, copy = False),
+                    "110_pf_max" : sxrd_cpf_results[:,7].astype(dtype, copy = False),
+                    "111_pf_max" : sxrd_cpf_results[:,8].astype(dtype, copy = False),
                     }
     
     print("The SXRD results using Fourier peak analysis have been written to new arrays with the following keys: ", cpf_beta_results.keys(), sep = '\n', end = '\n\n')
     
     return cpf_beta_results
 
-def load_sxrd_maud_beta(config_path: str):
+def load_sxrd_maud_beta(config_path: str, dtype = float, chunk_threshold: int = CHUNK_THRESHOLD):
     """Load SXRD beta-phase texture results refined using MAUD,
     using Rietveld refinement analysis, from text file 
     based on input parameters from a yaml configuration file.
     
     :param config_path: path to the configuration file.
+    :param dtype: Data type of the texture results arrays, use np.float32 to halve the memory.
+    :param chunk_threshold: File size (bytes) above which the results file is read in chunks.
     
     :return: SXRD beta texture results from MAUD as a dictionary, 
     containing arrays of texture refinement data.
@@ -383,23 +625,201 @@ def load_sxrd_maud_beta(config_path: str):
     print("The SXRD experiment number is: ", sxrd_experiment_number, sep = '\n', end = '\n\n')
     sxrd_maud_beta_results_file = config["file_paths"]["sxrd_maud_beta_results_file"].format(experiment_number = sxrd_experiment_number)
     print("The SXRD results file is: ", sxrd_maud_beta_results_file, sep = '\n', end = '\n\n')
-    sxrd_maud_results = np.loadtxt(sxrd_maud_beta_results_file, usecols = np.arange(0,9), dtype='str', skiprows = 1)
+    sxrd_maud_results = read_results_file(sxrd_maud_beta_results_file, 9, dtype = dtype, chunk_threshold = chunk_threshold)
     
     maud_beta_results = {
-                    "image_number" : sxrd_maud_results[:,0].astype(float),
-                    "texture_index" : sxrd_maud_results[:,1].astype(float),
-                    "odf_max" : sxrd_maud_results[:,2].astype(float),
-                    "phi1" : sxrd_maud_results[:,3].astype(float),
-                    "PHI" : sxrd_maud_results[:,4].astype(float),
-                    "phi2" : sxrd_maud_results[:,5].astype(float),
-                    "001_pf_max" : sxrd_maud_results[:,6].astype(float),
-                    "110_pf_max" : sxrd_maud_results[:,7].astype(float),
-                    "111_pf_max" : sxrd_maud_results[:,8].astype(float),
+                    "image_number" : sxrd_maud_results[:,0].astype(dtype, copy = False),
+                    "texture_index" : sxrd_maud_results[:,1].astype(dtype, copy = False),
+                    "odf_max" : sxrd_maud_results[:,2].astype(dtype, copy = False),
+                    "phi1" : sxrd_maud_results[:,3].astype(dtype, copy = False),
+                    "PHI" : sxrd_maud_results[:,4].astype(dtype, copy = False),
+                    "phi2" : sxrd_maud_results[:,5].astype(dtype, copy = False),
+                    "001_pf_max" : sxrd_maud_results[:,6].astype(dtype, copy = False),
+                    "110_pf_max" : sxrd_maud_results[:,7].astype(dtype, copy = False),
+                    "111_pf_max" : sxrd_maud_results[:,8].astype(dtype, copy = False),
                     }
     print("The SXRD results using MAUD have been written to new arrays with the following keys: ", maud_beta_results.keys(), sep = '\n', end = '\n\n')
     
     return maud_beta_results    
     
+RESULTS_COLUMNS = {
+                "alpha" : ["image_number", "texture_index", "odf_max", "phi1", "PHI", "phi2", "0002_pf_max", "10-10_pf_max", "11-20_pf_max"],
+                "beta" : ["image_number", "texture_index", "odf_max", "phi1", "PHI", "phi2", "001_pf_max", "110_pf_max", "111_pf_max"],
+                }
+# Names of the columns in the EBSD and SXRD texture results files for each phase.
+
+VOLUME_COLUMNS = {
+                ("ebsd", "alpha") : ["basal_TD_volume", "basal_RD_volume"],
+                ("ebsd", "beta") : ["rotated_cube_volume", "alpha_fibre_volume", "gamma_fibre_volume"],
+                ("cpf", "alpha") : ["basal_TD_volume_fraction", "basal_ND_volume_fraction", "basal_RD_volume_fraction", "basal_45_volume_fraction"],
+                ("cpf", "beta") : ["cube_volume_fraction", "rotated_cube_volume_fraction", "alpha_fibre_volume_fraction", "gamma_fibre_volume_fraction"],
+                ("maud", "alpha") : [],
+                ("maud", "beta") : [],
+                }
+# Names of the texture component volume columns that follow the texture results columns, when present in the file.
+
+RESULTS_FILE_KEYS = {
+                "ebsd" : "ebsd_{phase}_results_file",
+                "cpf" : "sxrd_cpf_{phase}_results_file",
+                "maud" : "sxrd_maud_{phase}_results_file",
+                }
+# Configuration file path keys for the texture results of each fitting type.
+
+def get_experiment_numbers(config: dict) -> list:
+    """Return the SXRD experiment numbers from a configuration, using 
+    an optional 'sxrd_experiment_numbers' list to sweep over several 
+    experiments, otherwise the single 'sxrd_experiment_number'.
+    
+    :param config: Dictionary containing the configuration file contents.
+    
+    :return: List of SXRD experiment numbers.
+    """
+    user_inputs = config["user_inputs"]
+    if "sxrd_experiment_numbers" in user_inputs:
+        return list(user_inputs["sxrd_experiment_numbers"])
+    
+    return [user_inputs["sxrd_experiment_number"]]
+
+CSV_WRITE_SIZE = 10000
+# Number of rows formatted in each write to the CSV file of the exported comparison tables.
+
+def export_comparison_tables(config_paths: list, output_path: str, chunk_size: int = CHUNK_SIZE, dtype = float):
+    """Export aligned per-frame tables of EBSD, SXRD-CPF and SXRD-MAUD 
+    texture results, for both phases and every experiment in one or more 
+    yaml configuration files, to a single compressed numpy (.npz) file 
+    of columns and a CSV file. The results files are streamed in blocks 
+    of rows, and every CSV_WRITE_SIZE rows are written to the buffered 
+    CSV file with a single format call, with the label columns and the 
+    columns not measured by the fitting type written as fixed text. The 
+    CSV file is written to a temporary name and only renamed when the 
+    export finishes. The .npz file is written once from all of the 
+    blocks at the end, so the whole table is held in memory.
+    
+    Results files that do not exist are skipped. A results file is only 
+    exported once for each fitting type and phase, so results paths 
+    without an experiment or stage placeholder, such as the EBSD results 
+    files, are not repeated for every experiment in a sweep or every 
+    multi-hit stage. Rows from a path without an {experiment_number} 
+    placeholder have an experiment_number of -1, and rows from a path 
+    without a {stage_number} placeholder have a stage_number of -1.
+    
+    Values are written to the CSV file with one more significant digit 
+    than the precision of dtype, 7 for np.float32 and 16 for float, so 
+    that the values match the source files without rounding noise.
+    
+    :param config_paths: List of paths to the configuration files.
+    :param output_path: File path for the output tables, without a file extension.
+    :param chunk_size: Number of rows read and written in each block.
+    :param dtype: Data type of the texture results columns, use np.float32 to halve the file size.
+    
+    :return: Dictionary containing the columns of the exported table.
+    """
+    metric_names = []
+    for names in [RESULTS_COLUMNS["alpha"][1:], RESULTS_COLUMNS["beta"][1:], *VOLUME_COLUMNS.values()]:
+        for name in names:
+            if name not in metric_names:
+                metric_names.append(name)
+    
+    label_names = ["experiment_number", "image_number", "stage_number", "phase", "method"]
+    
+    value_format = f"%.{np.finfo(dtype).precision + 1}g"
+    
+    blocks = []
+    labels = []
+    exported_files = set()
+    
+    pathlib.Path(output_path).parent.mkdir(parents = True, exist_ok = True)
+    csv_path = pathlib.Path(f"{output_path}.csv")
+    csv_temporary_path = pathlib.Path(f"{output_path}.csv.tmp")
+    
+    with open(csv_temporary_path, "w", buffering = 2**20) as csv_file:
+        csv_file.write(",".join(label_names + metric_names) + "\n")
+        
+        for config_path in config_paths:
+            config = get_config(config_path)
+            user_inputs = config["user_inputs"]
+            phases = [user_inputs["phase_1"], user_inputs["phase_2"]]
+            stage_numbers = user_inputs.get("stage_number", [1])
+            image_number_end = user_inputs.get("image_number_end", [0])
+            
+            for sxrd_experiment_number in get_experiment_numbers(config):
+                for method, results_file_key in RESULTS_FILE_KEYS.items():
+                    for phase in phases:
+                        
+                        file_key = results_file_key.format(phase = phase)
+                        if file_key not in config["file_paths"]:
+                            continue
+                        
+                        for count, stage_number in enumerate(stage_numbers):
+                            
+                            results_file_template = config["file_paths"][file_key]
+                            results_file = results_file_template.format(experiment_number = sxrd_experiment_number, stage_number = stage_number)
+                            if (method, phase, results_file) in exported_files:
+                                continue
+                            exported_files.add((method, phase, results_file))
+                            
+                            if not pathlib.Path(results_file).is_file():
+                                print("The results file was not found and has been skipped: ", results_file, sep = '\n', end = '\n\n')
+                                continue
+                            print("The results file is: ", results_file, sep = '\n', end = '\n\n')
+                            
+                            experiment_label = sxrd_experiment_number if "{experiment_number" in results_file_template else -1
+                            stage_label = stage_number if "{stage_number" in results_file_template else -1
+                            image_number_last = sum(image_number_end[:count])
+                            
+                            names = RESULTS_COLUMNS[phase] + VOLUME_COLUMNS[(method, phase)]
+                            with open(results_file) as file:
+                                file.readline()
+                                n_columns = min(len(file.readline().split()), len(names))
+                            metric_index = [1 + metric_names.index(name) for name in names[1:n_columns]]
+                            
+                            # Metric columns not measured in this results file are written as fixed nan text.
+                            metric_formats = ["nan"]*len(metric_names)
+                            for index in metric_index:
+                                metric_formats[index - 1] = value_format
+                            metric_order = np.argsort(metric_index)
+                            row_format = f"{experiment_label},{value_format},{stage_label},{phase},{method}," + ",".join(metric_formats) + "\n"
+                            
+                            for chunk in iterate_results_file(results_file, n_columns, chunk_size, dtype):
+                                chunk[:,0] = chunk[:,0] + image_number_last
+                                chunk_values = np.column_stack((chunk[:,0], chunk[:,1:][:,metric_order]))
+                                
+                                for start in range(0, len(chunk_values), CSV_WRITE_SIZE):
+                                    write_values = chunk_values[start:start + CSV_WRITE_SIZE]
+                                    csv_file.write((row_format*len(write_values)) % tuple(write_values.ravel().tolist()))
+                                
+                                block = np.full((len(chunk), 1 + len(metric_names)), np.nan, dtype)
+                                block[:,0] = chunk[:,0]
+                                block[:,metric_index] = chunk[:,1:]
+                                
+                                blocks.append(block)
+                                labels.append((experiment_label, stage_label, phase, method, len(block)))
+    
+    csv_temporary_path.replace(csv_path)
+    
+    if blocks:
+        table_values = np.concatenate(blocks)
+    else:
+        table_values = np.empty((0, 1 + len(metric_names)), dtype)
+    n_rows = [label[4] for label in labels]
+    
+    table = {
+            "experiment_number" : np.repeat([label[0] for label in labels], n_rows).astype(int),
+            "image_number" : table_values[:,0],
+            "stage_number" : np.repeat([label[1] for label in labels], n_rows).astype(int),
+            "phase" : np.repeat([label[2] for label in labels], n_rows).astype(str),
+            "method" : np.repeat([label[3] for label in labels], n_rows).astype(str),
+            }
+    for i, name in enumerate(metric_names):
+        table[name] = table_values[:,1 + i]
+    
+    np.savez_compressed(f"{output_path}.npz", **table)
+    
+    print(f"Table saved to: {output_path}.npz")
+    print(f"Table saved to: {output_path}.csv")
+    
+    return table
+
 def plot_texture_strength(sxrd_experiment_number: int, phase: str, texture_strength_type: str, output_folder: str,
                           ebsd_results: dict, cpf_results: dict, maud_results: dict):
     """Plot texture strength versus image (frame) number
@@ -707,4 +1127,153 @@ def plot_texture_component_two_phase(output_folder: str, sxrd_experiment_number:
     fig.tight_layout()
     fig.savefig(f"{output_folder}{fitting_type}/{sxrd_experiment_number:03d}_{phase}_texture_component_{fitting_type}.png", facecolor = "white", edgecolor = "white")
     
-    print(f"Figure saved to: {output_folder}{fitting_type}/{sxrd_experiment_number:03d}_{phase}_texture_component_{fitting_type}.png")
\ No newline at end of file
+    print(f"Figure saved to: {output_folder}{fitting_type}/{sxrd_experiment_number:03d}_{phase}_texture_component_{fitting_type}.png")
+    
+MAX_TRACE_POINTS = 1000
+# Maximum number of frames plotted in each texture strength trace of the campaign overview, unless a step is given.
+
+def plot_campaign_overview(table: dict, output_file: str, texture_strength_type: str, fitting_type: str,
+                           plot_type: str = "trace", phase: str = "alpha", n_columns: int = 5, rows_per_page: int = None,
+                           step: int = None, c_map: str = "viridis", shape_vertical: int = None, shape_horizontal: int = None, 
+                           step_size: float = None):
+    """Plot an overview of every experiment in a campaign as a grid of 
+    small plots with shared axes and colour scale, rendered from the 
+    columns of an exported comparison table. Options available to plot 
+    either texture strength versus image (frame) number for both alpha and 
+    beta phases, or 2D stage-scan maps of texture strength for one phase. 
+    Saving to a .pdf file with rows_per_page set splits the grid over 
+    multiple pages.
+    
+    :param table: Dictionary containing the columns of the comparison table, from export_comparison_tables or the saved .npz file.
+    :param output_file: File path to the output figure (.png) or multi-page document (.pdf).
+    :param texture_strength_type: Type of texture strength variable being plotted (choose from texture_index, odf_max, or any pole figure maxima).
+    :param fitting_type: Choose either 'ebsd, 'cpf', or 'maud' to signify the data analysis (fitting) used.
+    :param plot_type: Choose either 'trace' for texture strength versus frame number, or 'map' for stage-scan maps.
+    :param phase: Phase (alpha or beta) plotted in the stage-scan maps.
+    :param n_columns: Number of plots in each row of the grid.
+    :param rows_per_page: Number of rows of plots on each page of a .pdf file, defaults to all rows on one page.
+    :param step: Plot one frame in every step frames of the texture strength traces, defaults to the 
+    smallest step that keeps each trace within MAX_TRACE_POINTS frames.
+    :param c_map: Colour of the maps i.e. Reds, Blues, Greens, etc.
+    :param shape_vertical: Number of vertical synchrotron measurements in the stage-scan maps, required for 'map'.
+    :param shape_horizontal: Number of horizontal synchrotron measurements in the stage-scan maps, required for 'map'.
+    :param step_size: Step size of stage scan synchrotron measurements, required for 'map'.
+    """
+    if plot_type not in ("trace", "map"):
+        raise ValueError(f"plot_type must be either 'trace' or 'map', not '{plot_type}'.")
+    
+    if plot_type == "map" and None in (shape_vertical, shape_horizontal, step_size):
+        raise ValueError("shape_vertical, shape_horizontal and step_size are required for plot_type 'map', "
+                         "use the values from the user_inputs of the configuration file.")
+    
+    plt.rc('xtick', labelsize = 12)
+    plt.rc('ytick', labelsize = 12)
+    plt.rc('legend', fontsize = 12)
+    plt.rc('axes', linewidth = 1.5)
+    plt.rc('xtick.major', width = 1.5, size = 6)
+    plt.rc('xtick.minor', width = 1.5, size = 3)
+    plt.rc('ytick.major', width = 1.5, size = 6)
+    plt.rc('ytick.minor', width = 1.5, size = 3)
+    
+    method_rows = np.asarray(table["method"]) == fitting_type
+    experiment_numbers = list(dict.fromkeys(np.asarray(table["experiment_number"])[method_rows]))
+    
+    if not experiment_numbers:
+        print(f"No {fitting_type} results were found in the table.")
+        return
+    
+    if plot_type == "trace":
+        phases = ["alpha", "beta"]
+    
+    elif plot_type == "map":
+        phases = [phase]
+    
+    series = {}
+    for experiment_number in experiment_numbers:
+        experiment_rows = method_rows & (np.asarray(table["experiment_number"]) == experiment_number)
+        for series_phase in phases:
+            rows = experiment_rows & (np.asarray(table["phase"]) == series_phase)
+            image_number = np.asarray(table["image_number"])[rows]
+            values = np.asarray(table[texture_strength_type])[rows]
+            
+            if plot_type == "trace":
+                series_step = step if step is not None else max(1, int(np.ceil(len(values)/MAX_TRACE_POINTS)))
+                decimated_series = stream_decimated_series([np.column_stack((image_number, values))], 1, series_step)
+                image_number = decimated_series["image_number"]
+                values = decimated_series["values"]
+            
+            elif len(values) != shape_vertical*shape_horizontal:
+                raise ValueError(f"Experiment {experiment_number} has {len(values)} {series_phase} {fitting_type} results, "
+                                 f"which do not fit a {shape_vertical} x {shape_horizontal} stage-scan map.")
+            
+            series[(experiment_number, series_phase)] = (image_number, values)
+    
+    all_values = np.concatenate([values for image_number, values in series.values()])
+    if not np.isfinite(all_values).any():
+        raise ValueError(f"The {texture_strength_type} column has no values for the {fitting_type} results in the table.")
+    
+    v_min = np.nanmin(all_values)
+    v_max = np.nanmax(all_values)
+    
+    if texture_strength_type == "texture_index":
+        y_label = "Texture Index"
+    
+    elif texture_strength_type == "odf_max":
+        y_label = "ODF Maxima (mrd)"
+    
+    else:
+        y_label = texture_strength_type
+    
+    n_rows = int(np.ceil(len(experiment_numbers)/n_columns))
+    if rows_per_page is None or not output_file.endswith(".pdf"):
+        rows_per_page = n_rows
+    experiments_per_page = rows_per_page*n_columns
+    pages = [experiment_numbers[i:i + experiments_per_page] for i in range(0, len(experiment_numbers), experiments_per_page)]
+    
+    pdf = PdfPages(output_file) if output_file.endswith(".pdf") else None
+    
+    for page in pages:
+        page_rows = int(np.ceil(len(page)/n_columns))
+        fig, axes = plt.subplots(page_rows, n_columns, figsize = (4*n_columns, 3*page_rows), 
+                                 sharex = True, sharey = True, squeeze = False, layout = "constrained")
+        
+        for ax, experiment_number in zip(axes.flat, page):
+            ax.set_title(f"{experiment_number}", fontsize = 14)
+            
+            if plot_type == "trace":
+                image_number, values = series[(experiment_number, "alpha")]
+                ax.plot(image_number, values, color = "red", linewidth = 1.5, label = r"$\alpha$-phase")
+                image_number, values = series[(experiment_number, "beta")]
+                ax.plot(image_number, values, color = "blue", linewidth = 1.5, label = r"$\beta$-phase")
+                ax.set_ylim(v_min, v_max)
+            
+            elif plot_type == "map":
+                image_number, values = series[(experiment_number, phase)]
+                extent_vertical = (shape_vertical - 1)*step_size
+                extent_horizontal = (shape_horizontal - 1)*step_size
+                image = ax.imshow(values.reshape((shape_vertical, shape_horizontal)), interpolation = 'nearest', cmap = c_map, 
+                                  vmin = v_min, vmax = v_max, extent = [0,extent_horizontal,0,extent_vertical])
+        
+        for ax in axes.flat[len(page):]:
+            ax.set_axis_off()
+        
+        if plot_type == "trace":
+            fig.supxlabel("Frame Number", fontsize = 18)
+            fig.supylabel(y_label, fontsize = 18)
+            axes.flat[0].legend(loc = "upper right")
+        
+        elif plot_type == "map":
+            fig.supxlabel("X (mm)", fontsize = 18)
+            fig.supylabel("Y (mm)", fontsize = 18)
+            fig.colorbar(image, ax = axes, location = 'top', shrink = 0.4, label = y_label)
+        
+        if pdf is not None:
+            pdf.savefig(fig, facecolor = "white", edgecolor = "white")
+        else:
+            fig.savefig(output_file, facecolor = "white", edgecolor = "white")
+        plt.close(fig)
+    
+    if pdf is not None:
+        pdf.close()
+    
+    print(f"Figure saved to: {output_file}")